@@ -1,3 +1,4 @@
+using System.Net;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 using Synapic.Core.Interfaces;
@@ -57,10 +58,20 @@ public static class ServiceCollectionExtensions
         
         // Data source providers (registered as transient to allow multiple instances)
         services.AddTransient<IDataSourceProvider, LocalFileSystemProvider>();
-        services.AddTransient<IDataSourceProvider, DaminionProvider>();
         
-        // Model Repository
-        services.AddTransient<IModelRepository, LocalModelRepository>();
+        // Daminion uses a typed HttpClient so connections are pooled and reused
+        // by IHttpClientFactory instead of being tied to each provider instance
+        services.AddHttpClient<IDataSourceProvider, DaminionProvider>(client =>
+        {
+            // Prefer HTTP/2 so concurrent requests share one TLS connection;
+            // servers without HTTP/2 support negotiate down to HTTP/1.1
+            client.DefaultRequestVersion = HttpVersion.Version20;
+            client.DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower;
+            client.Timeout = options.HttpTimeout;
+        });
+        
+        // Model Repository (singleton so the models directory is scanned once, not per resolve)
+        services.AddSingleton<IModelRepository, LocalModelRepository>();
 
         // AI inference engine
         services.AddTransient<IModelInferenceEngine, TorchSharpInferenceEngine>();
@@ -68,9 +79,6 @@ public static class ServiceCollectionExtensions
         // Application services
         services.AddScoped<ProcessingManager>();
         
-        // HTTP client for infrastructure
-        services.AddHttpClient();
-        
         return services;
     }
 }
@@ -105,6 +113,11 @@ public class SynapicOptions
     /// </summary>
     public int MaxConcurrency { get; set; } = Environment.ProcessorCount;
     
+    /// <summary>
+    /// Timeout for a single request to a remote data source such as Daminion
+    /// </summary>
+    public TimeSpan HttpTimeout { get; set; } = TimeSpan.FromSeconds(30);
+    
     /// <summary>
     /// Default model for image classification
     /// </summary>
@@ -0,0 +1,62 @@
+namespace Synapic.Application.Services;
+
+/// <summary>
+/// Coalesces rapid updates so that only the latest value is applied, with at most one
+/// delivery queued on the target (e.g. UI) thread at a time
+/// </summary>
+public class LatestValueDispatcher<T>
+{
+    private readonly object _lock = new();
+    private readonly Action<Action> _post;
+    private readonly Action<T> _apply;
+    private T _pendingValue = default!;
+    private bool _isQueued;
+
+    /// <param name="post">Queues a callback onto the target thread (e.g. Dispatcher.InvokeAsync, Control.BeginInvoke)</param>
+    /// <param name="apply">Applies a value; always runs through <paramref name="post"/></param>
+    public LatestValueDispatcher(Action<Action> post, Action<T> apply)
+    {
+        _post = post;
+        _apply = apply;
+    }
+
+    /// <summary>
+    /// Record the latest value and queue a delivery unless one is already pending
+    /// </summary>
+    public void Post(T value)
+    {
+        lock (_lock)
+        {
+            _pendingValue = value;
+            if (_isQueued)
+                return;
+            _isQueued = true;
+        }
+
+        try
+        {
+            _post(Deliver);
+        }
+        catch
+        {
+            // Nothing was scheduled, so let the next value queue a fresh delivery
+            lock (_lock)
+            {
+                _isQueued = false;
+            }
+            throw;
+        }
+    }
+
+    private void Deliver()
+    {
+        T value;
+        lock (_lock)
+        {
+            value = _pendingValue;
+            _isQueued = false;
+        }
+
+        _apply(value);
+    }
+}
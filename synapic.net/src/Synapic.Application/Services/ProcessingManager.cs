@@ -1,4 +1,5 @@
 using Microsoft.Extensions.Logging;
+using Synapic.Application.Configuration;
 using Synapic.Core.Entities;
 using Synapic.Core.Interfaces;
 using System.Diagnostics;
@@ -14,6 +15,7 @@ public class ProcessingManager
     private readonly IDataSourceProvider _dataSourceProvider;
     private readonly IModelInferenceEngine _inferenceEngine;
     private readonly IImageMetadataService _imageMetadataService;
+    private readonly SynapicOptions _options;
     private ProcessingSession? _session;
     
     private CancellationTokenSource? _cancellationTokenSource;
@@ -30,12 +32,14 @@ public class ProcessingManager
         ILogger<ProcessingManager> logger,
         IDataSourceProvider dataSourceProvider,
         IModelInferenceEngine inferenceEngine,
-        IImageMetadataService imageMetadataService)
+        IImageMetadataService imageMetadataService,
+        SynapicOptions options)
     {
         _logger = logger;
         _dataSourceProvider = dataSourceProvider;
         _inferenceEngine = inferenceEngine;
         _imageMetadataService = imageMetadataService;
+        _options = options;
     }
 
     public async Task StartProcessingAsync(ProcessingSession session)
@@ -87,57 +91,93 @@ public class ProcessingManager
             if (_session == null) throw new InvalidOperationException("Session is null");
             _session.Results.Clear();
 
-            // Step 1: Fetch items
+            // Step 1: Fetch items and initialize the model concurrently. Loading the model
+            // does not depend on the item list, so it overlaps with the data source round-trips.
             Log("Fetching items from data source...");
-            var items = await FetchItemsAsync(cancellationToken);
+            var fetchTask = FetchItemsAsync(cancellationToken);
+
+            Log("Initializing AI model...");
+            var modelProgress = new Progress<string>(msg => Log(msg));
+            var initializeCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+            var initializeTask = _inferenceEngine.InitializeAsync(_session.Engine, modelProgress, initializeCts.Token);
+
+            IEnumerable<MediaItem> items;
+            try
+            {
+                items = await fetchTask;
+            }
+            catch
+            {
+                // Report the fetch failure now instead of after a model load nobody will use
+                AbandonInitialization(initializeTask, initializeCts);
+                throw;
+            }
             
             if (!items.Any())
             {
+                AbandonInitialization(initializeTask, initializeCts);
                 Log("No items to process");
                 return;
             }
 
+            using (initializeCts)
+            {
+                await initializeTask;
+            }
+
             _session.TotalItems = items.Count();
             Log($"Found {_session.TotalItems} items to process");
 
-            // Step 2: Initialize model
-            Log("Initializing AI model...");
-            var modelProgress = new Progress<string>(msg => Log(msg));
-            await _inferenceEngine.InitializeAsync(_session.Engine, modelProgress, cancellationToken);
-
-            // Step 3: Process items
+            // Step 2: Process items, up to MaxConcurrency at a time
             Log("Processing items...");
+            var session = _session;
+            var sessionLock = new object();
             int processedCount = 0;
 
-            foreach (var item in items)
+            var parallelOptions = new ParallelOptions
             {
-                if (cancellationToken.IsCancellationRequested)
-                    break;
+                MaxDegreeOfParallelism = Math.Max(1, _options.MaxConcurrency),
+                CancellationToken = cancellationToken
+            };
 
+            await Parallel.ForEachAsync(items, parallelOptions, async (item, itemCancellationToken) =>
+            {
                 try
                 {
-                    var result = await ProcessSingleItemAsync(item, cancellationToken);
-                    _session.Results.Add(result);
-                    
-                    if (result.Success)
-                    {
-                        _session.ProcessedItems++;
-                    }
-                    else
+                    var result = await ProcessSingleItemAsync(item, itemCancellationToken);
+                    int current, total;
+
+                    lock (sessionLock)
                     {
-                        _session.FailedItems++;
+                        session.Results.Add(result);
+                        
+                        if (result.Success)
+                        {
+                            session.ProcessedItems++;
+                        }
+                        else
+                        {
+                            session.FailedItems++;
+                        }
+
+                        processedCount++;
+                        current = processedCount;
+                        total = session.TotalItems;
                     }
 
-                    processedCount++;
-                    ReportProgress(processedCount, _session.TotalItems);
+                    // Raise events outside the lock so a slow subscriber doesn't serialize the workers
+                    ReportProgress(current, total);
                     ItemProcessed?.Invoke(this, result);
                 }
                 catch (Exception ex)
                 {
                     _logger.LogError(ex, "Error processing item {ItemId}", item.Id);
-                    _session.FailedItems++;
+                    lock (sessionLock)
+                    {
+                        session.FailedItems++;
+                    }
                 }
-            }
+            });
 
             Log($"Processing completed: {_session.ProcessedItems} successful, {_session.FailedItems} failed");
         }
@@ -158,6 +198,17 @@ public class ProcessingManager
         }
     }
 
+    private static void AbandonInitialization(Task initializeTask, CancellationTokenSource initializeCts)
+    {
+        // Stop the model load without waiting for it; its outcome is observed in the background
+        initializeCts.Cancel();
+        _ = initializeTask.ContinueWith(t =>
+        {
+            _ = t.Exception;
+            initializeCts.Dispose();
+        }, TaskScheduler.Default);
+    }
+
     private async Task<IEnumerable<MediaItem>> FetchItemsAsync(CancellationToken cancellationToken)
     {
         var progress = new Progress<int>(count => Log($"Fetched {count} items..."));
@@ -241,7 +292,8 @@ public class ProcessingManager
 
     private void Log(string message)
     {
-        _logger.LogInformation(message);
+        // Pass the text as an argument; used as the template it would be parsed and cached per message
+        _logger.LogInformation("{Message}", message);
         LogMessage?.Invoke(this, message);
     }
 
@@ -0,0 +1,20 @@
+namespace Synapic.Core.Utilities;
+
+/// <summary>
+/// Single rule for cleaning keywords at ingestion, shared by every data source
+/// </summary>
+public static class KeywordNormalizer
+{
+    /// <summary>
+    /// Trim each keyword, drop null or blank ones and remove case-insensitive duplicates (first spelling wins)
+    /// </summary>
+    public static List<string> Normalize(IEnumerable<string?> keywords)
+    {
+        // External JSON can carry null entries, so filter before trimming
+        return keywords
+            .Where(k => !string.IsNullOrWhiteSpace(k))
+            .Select(k => k!.Trim())
+            .Distinct(StringComparer.OrdinalIgnoreCase)
+            .ToList();
+    }
+}
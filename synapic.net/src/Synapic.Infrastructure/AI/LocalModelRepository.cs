@@ -10,6 +10,7 @@ public class LocalModelRepository : IModelRepository
     private readonly ILogger<LocalModelRepository> _logger;
     private readonly string _modelsDirectory;
     private List<ModelInfo> _cachedModels = new();
+    private readonly Dictionary<string, ModelInfo> _modelsById = new(StringComparer.OrdinalIgnoreCase);
 
     public LocalModelRepository(ILogger<LocalModelRepository> logger)
     {
@@ -23,6 +24,7 @@ public class LocalModelRepository : IModelRepository
     private void ScanModels()
     {
         _cachedModels.Clear();
+        _modelsById.Clear();
         
         if (!Directory.Exists(_modelsDirectory))
         {
@@ -37,31 +39,41 @@ public class LocalModelRepository : IModelRepository
             {
                 try
                 {
-                    var json = File.ReadAllText(configPath);
-                    using var doc = JsonDocument.Parse(json);
+                    using var stream = File.OpenRead(configPath);
+                    using var doc = JsonDocument.Parse(stream);
                     var root = doc.RootElement; // Assuming config.json structure for now
+                    if (root.ValueKind != JsonValueKind.Object)
+                    {
+                        _logger.LogWarning("Skipping model at {Dir}: config.json is not a JSON object", dir);
+                        continue;
+                    }
                     
                     // Simple parsing logic - adapt based on actual config.json structure
                     // For sidecar.py generated configs, we might need specific property names
                     
                     var modelName = Path.GetFileName(dir); // Default to directory name
-                    if (root.TryGetProperty("name", out var nameProp)) modelName = nameProp.GetString() ?? modelName;
+                    if (root.TryGetProperty("name", out var nameProp) && nameProp.ValueKind == JsonValueKind.String)
+                        modelName = nameProp.GetString() ?? modelName;
                     
                     // Default task if not specified
                     var task = ModelTask.ImageToText; 
-                    if (root.TryGetProperty("task", out var taskProp) && Enum.TryParse<ModelTask>(taskProp.GetString(), true, out var parsedTask))
+                    if (root.TryGetProperty("task", out var taskProp) &&
+                        taskProp.ValueKind == JsonValueKind.String &&
+                        Enum.TryParse<ModelTask>(taskProp.GetString(), true, out var parsedTask))
                     {
                         task = parsedTask;
                     }
 
-                    _cachedModels.Add(new ModelInfo
+                    var model = new ModelInfo
                     {
                         Id = Path.GetFileName(dir),
                         Name = modelName,
                         Description = $"{task} Model",
                         Task = task,
                         Path = dir
-                    });
+                    };
+                    _cachedModels.Add(model);
+                    _modelsById[model.Id] = model;
                 }
                 catch (Exception ex)
                 {
@@ -80,6 +92,6 @@ public class LocalModelRepository : IModelRepository
 
     public ModelInfo? GetModel(string id)
     {
-        return _cachedModels.FirstOrDefault(m => m.Id.Equals(id, StringComparison.OrdinalIgnoreCase));
+        return _modelsById.TryGetValue(id, out var model) ? model : null;
     }
 }
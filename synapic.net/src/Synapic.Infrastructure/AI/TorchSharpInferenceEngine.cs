@@ -126,22 +126,16 @@ public class TorchSharpInferenceEngine : IModelInferenceEngine
 
         try
         {
-            _logger.LogInformation("Starting processing for image: {ImagePath}", imagePath);
             var sw = Stopwatch.StartNew();
-            long stepStart = 0;
 
             // Load image
             using var image = await _imageService.LoadImageAsync(imagePath);
             long loadTime = sw.ElapsedMilliseconds;
-            _logger.LogInformation("Image loaded in {Elapsed}ms. Dimensions: {Width}x{Height}", 
-                loadTime, image.Width, image.Height);
             
             // Preprocess
-            stepStart = sw.ElapsedMilliseconds;
+            long stepStart = sw.ElapsedMilliseconds;
             var tensor = await PreprocessImageAsync(image, cancellationToken);
             long preprocessTime = sw.ElapsedMilliseconds - stepStart;
-            _logger.LogInformation("Preprocessing completed in {Elapsed}ms. Input Tensor Shape: {Shape}", 
-                preprocessTime, string.Join("x", tensor.shape));
 
             // Run inference
             try
@@ -151,19 +145,25 @@ public class TorchSharpInferenceEngine : IModelInferenceEngine
                 Tensor output = ((dynamic)_model).forward(tensor);
                 long inferenceTime = sw.ElapsedMilliseconds - stepStart;
                 
-                // Log output stats
-                float minVal = output.min().ToSingle();
-                float maxVal = output.max().ToSingle();
-                _logger.LogInformation("Inference completed in {Elapsed}ms. Output Tensor: Shape={Shape}, Min={Min}, Max={Max}", 
-                    inferenceTime, string.Join("x", output.shape), minVal, maxVal);
+                // Output stats cost two extra tensor reductions, so only compute them when they will be logged
+                if (_logger.IsEnabled(LogLevel.Debug))
+                {
+                    using var minVal = output.min();
+                    using var maxVal = output.max();
+                    _logger.LogDebug("Output Tensor for {ImagePath}: Shape={Shape}, Min={Min}, Max={Max}", 
+                        imagePath, string.Join("x", output.shape), minVal.ToSingle(), maxVal.ToSingle());
+                }
 
                 // Post-process results
                 stepStart = sw.ElapsedMilliseconds;
                 (string? category, List<string> keywords, string? description) = await PostProcessResultsAsync(output, cancellationToken);
                 long postProcessTime = sw.ElapsedMilliseconds - stepStart;
                 
-                _logger.LogInformation("Post-processing completed in {Elapsed}ms. Total pipeline time: {Total}ms", 
-                    postProcessTime, sw.ElapsedMilliseconds);
+                // One summary line per image rather than one per pipeline stage
+                _logger.LogInformation(
+                    "Processed {ImagePath} ({Width}x{Height}) in {Total}ms: load {Load}ms, preprocess {Preprocess}ms, inference {Inference}ms, post-process {PostProcess}ms", 
+                    imagePath, image.Width, image.Height, sw.ElapsedMilliseconds, 
+                    loadTime, preprocessTime, inferenceTime, postProcessTime);
                 
                 return (category, keywords, description);
             }
@@ -183,11 +183,12 @@ public class TorchSharpInferenceEngine : IModelInferenceEngine
     {
         return await Task.Run(() =>
         {
-            // Resize to 224x224 (standard for many vision models)
-            var resized = image.Clone(ctx => ctx.Resize(224, 224));
+            // Resize to 224x224 (standard for many vision models) before converting,
+            // so the pixel-format copy only touches the small image
+            using var resized = image.Clone(ctx => ctx.Resize(224, 224));
             
-            // Convert to RGB if needed
-            var rgb = resized.CloneAs<Rgb24>();
+            // Convert to RGB if needed; both intermediates are disposed as soon as the tensor is built
+            using var rgb = resized.CloneAs<Rgb24>();
             
             // Convert to tensor [1, 3, 224, 224]
             var pixels = new float[1 * 3 * 224 * 224];
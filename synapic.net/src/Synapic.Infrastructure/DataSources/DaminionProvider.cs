@@ -1,9 +1,11 @@
+using System.Net;
 using System.Net.Http.Json;
 using System.Text;
 using System.Text.Json;
 using Microsoft.Extensions.Logging;
 using Synapic.Core.Entities;
 using Synapic.Core.Interfaces;
+using Synapic.Core.Utilities;
 
 namespace Synapic.Infrastructure.DataSources;
 
@@ -12,12 +14,19 @@ namespace Synapic.Infrastructure.DataSources;
 /// </summary>
 public class DaminionProvider : IDataSourceProvider
 {
+    private const int MaxRetries = 3;
+
     private readonly ILogger<DaminionProvider> _logger;
     private readonly IImageMetadataService _imageService;
     private readonly HttpClient _httpClient;
     private string? _authToken;
     private string? _baseUrl;
+    private Uri? _tagLayoutUri;
+    private Uri? _itemCountUri;
+    private Uri? _itemsUri;
+    private Uri? _batchUpdateUri;
     private Dictionary<int, string> _tagSchema = new();
+    private string? _tagSchemaUrl;
 
     public DaminionProvider(
         ILogger<DaminionProvider> logger,
@@ -33,9 +42,29 @@ public class DaminionProvider : IDataSourceProvider
     {
         try
         {
+            // Reject bad configuration locally instead of spending a network round-trip on it
+            if (!Uri.TryCreate(config.DaminionUrl, UriKind.Absolute, out var serverUri) ||
+                (serverUri.Scheme != Uri.UriSchemeHttp && serverUri.Scheme != Uri.UriSchemeHttps))
+            {
+                _logger.LogError("Invalid Daminion server URL: {Url}", config.DaminionUrl);
+                return false;
+            }
+
+            if (string.IsNullOrEmpty(config.DaminionUser) || string.IsNullOrEmpty(config.DaminionPassword))
+            {
+                _logger.LogError("Daminion credentials are not configured");
+                return false;
+            }
+
             _baseUrl = config.DaminionUrl.TrimEnd('/');
             _logger.LogInformation("Connecting to Daminion server: {Url}", _baseUrl);
 
+            // Endpoints only depend on the server URL, so build them once per connection
+            _tagLayoutUri = new Uri($"{_baseUrl}/api/Tags/GetLayout");
+            _itemCountUri = new Uri($"{_baseUrl}/api/MediaItems/GetCount");
+            _itemsUri = new Uri($"{_baseUrl}/api/MediaItems/Get");
+            _batchUpdateUri = new Uri($"{_baseUrl}/api/ItemData/BatchUpdate");
+
             // Authenticate
             var authPayload = new
             {
@@ -43,9 +72,11 @@ public class DaminionProvider : IDataSourceProvider
                 password = config.DaminionPassword
             };
 
-            var response = await _httpClient.PostAsJsonAsync(
-                $"{_baseUrl}/api/Authentication/Authenticate",
-                authPayload,
+            using var response = await SendWithRetryAsync(
+                () => _httpClient.PostAsJsonAsync(
+                    $"{_baseUrl}/api/Authentication/Authenticate",
+                    authPayload,
+                    cancellationToken),
                 cancellationToken);
 
             if (!response.IsSuccessStatusCode)
@@ -69,8 +100,11 @@ public class DaminionProvider : IDataSourceProvider
 
             _logger.LogInformation("Successfully authenticated with Daminion");
 
-            // Load tag schema
-            await LoadTagSchemaAsync(cancellationToken);
+            // Load tag schema (it only changes per server, so keep it across reconnects)
+            if (_tagSchemaUrl != _baseUrl)
+            {
+                await LoadTagSchemaAsync(cancellationToken);
+            }
 
             return true;
         }
@@ -91,16 +125,21 @@ public class DaminionProvider : IDataSourceProvider
 
     private async Task LoadTagSchemaAsync(CancellationToken cancellationToken)
     {
+        // Drop the previous server's tags up front so a failed load never leaves them behind
+        _tagSchema.Clear();
+        _tagSchemaUrl = null;
+
         try
         {
-            var response = await _httpClient.GetAsync(
-                $"{_baseUrl}/api/Tags/GetLayout",
+            using var response = await SendWithRetryAsync(
+                () => _httpClient.GetAsync(_tagLayoutUri, cancellationToken),
                 cancellationToken);
 
             if (response.IsSuccessStatusCode)
             {
                 var layout = await response.Content.ReadFromJsonAsync<JsonElement>(cancellationToken: cancellationToken);
                 ExtractTagsFromLayout(layout);
+                _tagSchemaUrl = _baseUrl;
                 _logger.LogInformation("Loaded {Count} tags from schema", _tagSchema.Count);
             }
         }
@@ -144,9 +183,8 @@ public class DaminionProvider : IDataSourceProvider
         {
             var query = BuildSearchQuery(config);
             
-            var response = await _httpClient.PostAsJsonAsync(
-                $"{_baseUrl}/api/MediaItems/GetCount",
-                query,
+            using var response = await SendWithRetryAsync(
+                () => _httpClient.PostAsJsonAsync(_itemCountUri, query, cancellationToken),
                 cancellationToken);
 
             if (response.IsSuccessStatusCode)
@@ -178,9 +216,8 @@ public class DaminionProvider : IDataSourceProvider
             query["index"] = 0;
             query["pageSize"] = Math.Min(config.MaxItems, 200);
 
-            var response = await _httpClient.PostAsJsonAsync(
-                $"{_baseUrl}/api/MediaItems/Get",
-                query,
+            using var response = await SendWithRetryAsync(
+                () => _httpClient.PostAsJsonAsync(_itemsUri, query, cancellationToken),
                 cancellationToken);
 
             if (!response.IsSuccessStatusCode)
@@ -220,16 +257,22 @@ public class DaminionProvider : IDataSourceProvider
     {
         try
         {
-            var response = await _httpClient.GetAsync(
-                $"{_baseUrl}/api/Thumbnail/Get/{itemId}?width={width}&height={height}",
+            // Only wait for headers so the body can be streamed straight to disk
+            using var response = await SendWithRetryAsync(
+                () => _httpClient.GetAsync(
+                    $"{_baseUrl}/api/Thumbnail/Get/{itemId}?width={width}&height={height}",
+                    HttpCompletionOption.ResponseHeadersRead,
+                    cancellationToken),
                 cancellationToken);
 
             if (!response.IsSuccessStatusCode)
                 return null;
 
-            var bytes = await response.Content.ReadAsByteArrayAsync(cancellationToken);
             var tempPath = Path.Combine(Path.GetTempPath(), $"daminion_thumb_{itemId}.jpg");
-            await File.WriteAllBytesAsync(tempPath, bytes, cancellationToken);
+            await using (var file = File.Create(tempPath))
+            {
+                await response.Content.CopyToAsync(file, cancellationToken);
+            }
 
             return tempPath;
         }
@@ -272,9 +315,8 @@ public class DaminionProvider : IDataSourceProvider
                 tags = updates
             };
 
-            var response = await _httpClient.PostAsJsonAsync(
-                $"{_baseUrl}/api/ItemData/BatchUpdate",
-                payload,
+            using var response = await SendWithRetryAsync(
+                () => _httpClient.PostAsJsonAsync(_batchUpdateUri, payload, cancellationToken),
                 cancellationToken);
 
             if (response.IsSuccessStatusCode)
@@ -294,6 +336,44 @@ public class DaminionProvider : IDataSourceProvider
         }
     }
 
+    /// <summary>
+    /// Send a request, retrying transient failures (timeouts, throttling, 5xx) with exponential backoff
+    /// </summary>
+    private async Task<HttpResponseMessage> SendWithRetryAsync(
+        Func<Task<HttpResponseMessage>> send,
+        CancellationToken cancellationToken)
+    {
+        for (int attempt = 1; ; attempt++)
+        {
+            try
+            {
+                var response = await send();
+                if (!IsTransient(response.StatusCode) || attempt >= MaxRetries)
+                    return response;
+
+                _logger.LogWarning("Daminion request returned {StatusCode} on attempt {Attempt}/{MaxRetries}",
+                    response.StatusCode, attempt, MaxRetries);
+                response.Dispose();
+            }
+            catch (HttpRequestException ex) when (attempt < MaxRetries)
+            {
+                _logger.LogWarning(ex, "Daminion request failed on attempt {Attempt}/{MaxRetries}", attempt, MaxRetries);
+            }
+            catch (TaskCanceledException ex) when (!cancellationToken.IsCancellationRequested && attempt < MaxRetries)
+            {
+                // HttpClient surfaces its own timeout as a cancellation
+                _logger.LogWarning(ex, "Daminion request timed out on attempt {Attempt}/{MaxRetries}", attempt, MaxRetries);
+            }
+
+            await Task.Delay(500 * (1 << (attempt - 1)), cancellationToken); // Exponential backoff
+        }
+    }
+
+    private static bool IsTransient(HttpStatusCode statusCode) =>
+        statusCode == HttpStatusCode.RequestTimeout ||
+        statusCode == HttpStatusCode.TooManyRequests ||
+        (int)statusCode >= 500;
+
     private Dictionary<string, object> BuildSearchQuery(DataSourceConfig config)
     {
         var query = new Dictionary<string, object>();
@@ -335,7 +415,9 @@ public class DaminionProvider : IDataSourceProvider
             Id = damItem.Id,
             FilePath = damItem.FilePath ?? "",
             Category = damItem.Category,
-            Keywords = damItem.Keywords?.ToList() ?? new List<string>(),
+            Keywords = damItem.Keywords != null
+                ? KeywordNormalizer.Normalize(damItem.Keywords)
+                : new List<string>(),
             Description = damItem.Description,
             IsFlagged = damItem.IsFlagged,
             IsRejected = damItem.IsRejected
@@ -10,6 +10,12 @@ namespace Synapic.Infrastructure.Persistence;
 /// </summary>
 public class JsonSessionRepository : ISessionRepository
 {
+    private static readonly JsonSerializerOptions SerializerOptions = new()
+    {
+        WriteIndented = true,
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+    };
+
     private readonly ILogger<JsonSessionRepository> _logger;
     private readonly string _configDirectory;
     private readonly string _configFilePath;
@@ -33,14 +39,14 @@ public class JsonSessionRepository : ISessionRepository
             // Ensure directory exists
             Directory.CreateDirectory(_configDirectory);
 
-            var options = new JsonSerializerOptions
+            // Serialize straight into a temp file rather than building the whole JSON string first,
+            // then swap it in so a failed write never truncates the previous session
+            var tempFilePath = _configFilePath + ".tmp";
+            await using (var stream = File.Create(tempFilePath))
             {
-                WriteIndented = true,
-                PropertyNamingPolicy = JsonNamingPolicy.CamelCase
-            };
-
-            var json = JsonSerializer.Serialize(session, options);
-            await File.WriteAllTextAsync(_configFilePath, json);
+                await JsonSerializer.SerializeAsync(stream, session, SerializerOptions);
+            }
+            File.Move(tempFilePath, _configFilePath, overwrite: true);
 
             _logger.LogInformation("Session saved to {Path}", _configFilePath);
         }
@@ -55,24 +61,19 @@ public class JsonSessionRepository : ISessionRepository
     {
         try
         {
-            if (!File.Exists(_configFilePath))
-            {
-                _logger.LogInformation("No saved session found at {Path}", _configFilePath);
-                return null;
-            }
-
-            var json = await File.ReadAllTextAsync(_configFilePath);
-            
-            var options = new JsonSerializerOptions
-            {
-                PropertyNamingPolicy = JsonNamingPolicy.CamelCase
-            };
-
-            var session = JsonSerializer.Deserialize<ProcessingSession>(json, options);
+            // Open directly rather than checking File.Exists first, which could race with a
+            // concurrent clear; deserialize straight from the stream instead of buffering the text
+            await using var stream = File.OpenRead(_configFilePath);
+            var session = await JsonSerializer.DeserializeAsync<ProcessingSession>(stream, SerializerOptions);
             
             _logger.LogInformation("Session loaded from {Path}", _configFilePath);
             return session;
         }
+        catch (Exception ex) when (ex is FileNotFoundException or DirectoryNotFoundException)
+        {
+            _logger.LogInformation("No saved session found at {Path}", _configFilePath);
+            return null;
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error loading session from {Path}", _configFilePath);
@@ -84,11 +85,9 @@ public class JsonSessionRepository : ISessionRepository
     {
         try
         {
-            if (File.Exists(_configFilePath))
-            {
-                File.Delete(_configFilePath);
-                _logger.LogInformation("Session cleared from {Path}", _configFilePath);
-            }
+            // File.Delete is a no-op when the file is missing, so no existence check is needed
+            File.Delete(_configFilePath);
+            _logger.LogInformation("Session cleared from {Path}", _configFilePath);
             
             await Task.CompletedTask;
         }
@@ -1,5 +1,6 @@
 using Microsoft.Extensions.Logging;
 using Synapic.Core.Interfaces;
+using Synapic.Core.Utilities;
 using SixLabors.ImageSharp;
 using SixLabors.ImageSharp.Metadata.Profiles.Exif;
 using SixLabors.ImageSharp.Metadata.Profiles.Iptc;
@@ -14,6 +15,9 @@ namespace Synapic.Infrastructure.Services;
 /// </summary>
 public class ImageMetadataService : IImageMetadataService
 {
+    // IPTC IIM limit for the Keywords dataset (2:25); ImageSharp truncates to this in strict mode
+    private const int MaxIptcKeywordLength = 64;
+
     private readonly ILogger<ImageMetadataService> _logger;
 
     public ImageMetadataService(ILogger<ImageMetadataService> logger)
@@ -44,7 +48,8 @@ public class ImageMetadataService : IImageMetadataService
                     var keywordTags = iptcDirectory.GetStringArray(IptcDirectory.TagKeywords);
                     if (keywordTags != null)
                     {
-                        keywords.AddRange(keywordTags);
+                        // Normalize at ingestion so filters and later writes see each keyword once
+                        keywords.AddRange(KeywordNormalizer.Normalize(keywordTags));
                     }
                     
                     // Description/Caption
@@ -95,12 +100,25 @@ public class ImageMetadataService : IImageMetadataService
                         iptcProfile.SetValue(IptcTag.Category, category);
                     }
 
-                    // Write keywords
+                    // Write keywords (Keywords is repeatable, so SetValue appends; skip values
+                    // already stored instead of duplicating them every time an image is processed)
                     if (keywords != null && keywords.Any())
                     {
+                        var existingKeywords = new HashSet<string>(
+                            iptcProfile.GetValues(IptcTag.Keywords).Select(v => v.Value),
+                            StringComparer.OrdinalIgnoreCase);
+
                         foreach (var keyword in keywords)
                         {
-                            iptcProfile.SetValue(IptcTag.Keywords, keyword);
+                            // SetValue is strict and truncates Keywords, so compare the value as it will be stored
+                            var storedKeyword = keyword.Length > MaxIptcKeywordLength
+                                ? keyword[..MaxIptcKeywordLength]
+                                : keyword;
+
+                            if (existingKeywords.Add(storedKeyword))
+                            {
+                                iptcProfile.SetValue(IptcTag.Keywords, storedKeyword);
+                            }
                         }
                     }
 
@@ -159,10 +177,10 @@ public class ImageMetadataService : IImageMetadataService
                     return (false, "File does not exist");
                 }
 
-                // Try to load the image
-                using var image = Image.Load(imagePath);
+                // Identify only reads the header; the pixels are decoded once, later, for inference
+                var info = Image.Identify(imagePath);
                 
-                if (image.Width == 0 || image.Height == 0)
+                if (info.Width == 0 || info.Height == 0)
                 {
                     return (false, "Invalid image dimensions");
                 }
@@ -1,6 +1,5 @@
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Hosting;
-using Microsoft.Extensions.Logging;
 using System.Windows;
 using Synapic.Application.Configuration;
 
@@ -29,13 +28,6 @@ public partial class App : System.Windows.Application
                     "Synapic", "Sessions");
             });
             
-            // Add logging
-            services.AddLogging(builder =>
-            {
-                builder.AddConsole();
-                builder.AddDebug();
-            });
-            
             _serviceProvider = services.BuildServiceProvider();
             
             // Create and show main window
@@ -21,7 +21,11 @@ public partial class MainWindow : Window
         
         // Set DataContext with dependencies from service provider
         var logger = _serviceProvider.GetRequiredService<ILogger<MainViewModel>>();
-        DataContext = new MainViewModel(_serviceProvider, logger);
+        var viewModel = new MainViewModel(_serviceProvider, logger);
+        DataContext = viewModel;
+        
+        // The debounce timer stops with the dispatcher, so write any pending settings change now
+        Closing += (_, _) => viewModel.FlushSettings();
     }
     
     private void Window_Loaded(object sender, RoutedEventArgs e)
@@ -3,6 +3,7 @@ using System.IO;
 using System.Threading.Tasks;
 using System.Windows;
 using System.Windows.Input;
+using System.Windows.Threading;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 using Synapic.Application.Services;
@@ -20,7 +21,6 @@ public class MainViewModel : ViewModelBase
 {
     private readonly IServiceProvider _serviceProvider;
     private readonly ILogger<MainViewModel> _logger;
-    private readonly IModelRepository _modelRepository;
     private ProcessingManager? _processingManager;
     
     private bool _isProcessing;
@@ -46,18 +46,34 @@ public class MainViewModel : ViewModelBase
     private ModelTask _selectedModelTask = ModelTask.ImageToText;
     private int _deviceId = -1;
     
+    private readonly DispatcherTimer _saveSettingsTimer;
+    private readonly LatestValueDispatcher<string> _statusUpdates;
+    private readonly LatestValueDispatcher<ProgressEventArgs> _progressUpdates;
+    private bool _isLoadingSettings;
+    
     public MainViewModel(IServiceProvider serviceProvider, ILogger<MainViewModel> logger)
     {
         _serviceProvider = serviceProvider;
         _logger = logger;
-        _modelRepository = serviceProvider.GetRequiredService<IModelRepository>();
         
         StartProcessingCommand = new AsyncRelayCommand(StartProcessingAsync, _ => CanStartProcessing());
         StopProcessingCommand = new AsyncRelayCommand(StopProcessingAsync, _ => CanStopProcessing());
         BrowseFolderCommand = new RelayCommand(_ => BrowseFolder());
         ClearResultsCommand = new RelayCommand(_ => ClearResults());
 
-        RefreshModels();
+        // Coalesce bursts of changes (slider drags, typing) into a single registry write
+        _saveSettingsTimer = new DispatcherTimer { Interval = TimeSpan.FromMilliseconds(500) };
+        _saveSettingsTimer.Tick += (_, _) => FlushSettings();
+
+        // Bursts of log and progress events from concurrently processed items collapse into one UI update each
+        _statusUpdates = new LatestValueDispatcher<string>(PostToUi, message => StatusMessage = message);
+        _progressUpdates = new LatestValueDispatcher<ProgressEventArgs>(PostToUi, progress =>
+        {
+            CurrentProgress = (int)progress.Percentage;
+            StatusMessage = $"Processing {progress.Current} of {progress.Total} items";
+        });
+
+        _ = RefreshModelsAsync();
         LoadSettings();
     }
     
@@ -120,7 +136,7 @@ public class MainViewModel : ViewModelBase
         {
             if (SetProperty(ref _localPath, value))
             {
-                SaveSettings();
+                ScheduleSaveSettings();
             }
         }
     }
@@ -138,7 +154,7 @@ public class MainViewModel : ViewModelBase
         {
             if (SetProperty(ref _daminionUrl, value))
             {
-                SaveSettings();
+                ScheduleSaveSettings();
             }
         }
     }
@@ -150,7 +166,7 @@ public class MainViewModel : ViewModelBase
         {
             if (SetProperty(ref _daminionUser, value))
             {
-                SaveSettings();
+                ScheduleSaveSettings();
             }
         }
     }
@@ -162,7 +178,7 @@ public class MainViewModel : ViewModelBase
         {
             if (SetProperty(ref _daminionPassword, value))
             {
-                SaveSettings();
+                ScheduleSaveSettings();
             }
         }
     }
@@ -174,7 +190,7 @@ public class MainViewModel : ViewModelBase
         {
             if (SetProperty(ref _maxItems, value))
             {
-                SaveSettings();
+                ScheduleSaveSettings();
             }
         }
     }
@@ -305,13 +321,9 @@ public class MainViewModel : ViewModelBase
             // Create processing manager
             _processingManager = _serviceProvider.GetRequiredService<ProcessingManager>();
             
-            // Subscribe to events
+            // Subscribe to events (queued onto the dispatcher so the worker never waits on the UI)
             _processingManager.LogMessage += OnLogMessage;
-            _processingManager.ProgressChanged += (s, e) => System.Windows.Application.Current?.Dispatcher.Invoke(() =>
-        {
-            CurrentProgress = (int)e.Percentage;
-            StatusMessage = $"Processing {e.Current} of {e.Total} items";
-        });
+            _processingManager.ProgressChanged += OnProgressChanged;
             
             IsProcessing = true;
             StatusMessage = "Initializing...";
@@ -366,16 +378,22 @@ public class MainViewModel : ViewModelBase
     
     private void OnLogMessage(object? sender, string message)
     {
-        System.Windows.Application.Current?.Dispatcher.Invoke(() => StatusMessage = message);
+        _statusUpdates.Post(message);
     }
     
-    private void OnProgressChanged(object? sender, (int Percentage, string Message) e)
+    private void OnProgressChanged(object? sender, ProgressEventArgs e)
     {
-        System.Windows.Application.Current?.Dispatcher.Invoke(() =>
-        {
-            CurrentProgress = e.Percentage;
-            StatusMessage = e.Message;
-        });
+        _progressUpdates.Post(e);
+    }
+
+    private static void PostToUi(Action update)
+    {
+        // Without a running application there is no dispatcher to queue onto; apply in place
+        var dispatcher = System.Windows.Application.Current?.Dispatcher;
+        if (dispatcher != null)
+            dispatcher.InvokeAsync(update);
+        else
+            update();
     }
     
     private void CleanupProcessing()
@@ -383,8 +401,7 @@ public class MainViewModel : ViewModelBase
         if (_processingManager != null)
         {
             _processingManager.LogMessage -= OnLogMessage;
-            // Remove progress event handler
-            // Note: Since we used a lambda, we don't need to remove it explicitly
+            _processingManager.ProgressChanged -= OnProgressChanged;
             
             // Add results to the collection
             foreach (var result in _session.Results)
@@ -430,6 +447,8 @@ public class MainViewModel : ViewModelBase
 
     private void LoadSettings()
     {
+        // Each property setter below would otherwise write the value straight back to the registry
+        _isLoadingSettings = true;
         try
         {
             using var key = Registry.CurrentUser.OpenSubKey(@"Software\Synapic.NET");
@@ -446,6 +465,32 @@ public class MainViewModel : ViewModelBase
         {
             _logger.LogError(ex, "Failed to load settings from registry");
         }
+        finally
+        {
+            _isLoadingSettings = false;
+        }
+    }
+
+    private void ScheduleSaveSettings()
+    {
+        if (_isLoadingSettings)
+            return;
+            
+        // Restart the timer so only the last change in a burst is written
+        _saveSettingsTimer.Stop();
+        _saveSettingsTimer.Start();
+    }
+
+    /// <summary>
+    /// Write any pending settings change immediately (called when the window closes)
+    /// </summary>
+    public void FlushSettings()
+    {
+        if (!_saveSettingsTimer.IsEnabled)
+            return;
+            
+        _saveSettingsTimer.Stop();
+        SaveSettings();
     }
 
     private void SaveSettings()
@@ -468,12 +513,17 @@ public class MainViewModel : ViewModelBase
         }
     }
 
-    private void RefreshModels()
+    private async Task RefreshModelsAsync()
     {
         try
         {
+            // Resolving the repository scans the models directory, so keep it off the UI thread
+            var models = await Task.Run(() => _serviceProvider
+                .GetRequiredService<IModelRepository>()
+                .GetAvailableModels()
+                .ToList());
+
             AvailableModels.Clear();
-            var models = _modelRepository.GetAvailableModels();
             foreach (var model in models)
             {
                 AvailableModels.Add(model);
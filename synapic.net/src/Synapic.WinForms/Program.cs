@@ -1,7 +1,6 @@
 using System;
 using System.Windows.Forms;
 using Microsoft.Extensions.DependencyInjection;
-using Microsoft.Extensions.Logging;
 using Synapic.Application.Configuration;
 
 namespace Synapic.WinForms;
@@ -31,13 +30,6 @@ static class Program
                     "Synapic", "Sessions");
             });
             
-            // Add logging
-            services.AddLogging(builder =>
-            {
-                builder.AddConsole();
-                builder.AddDebug();
-            });
-            
             services.AddScoped<MainForm>();
             
             using var serviceProvider = services.BuildServiceProvider();
@@ -23,6 +23,8 @@ public class MainFormViewModel : INotifyPropertyChanged
     private string _statusMessage = "Ready";
     private readonly BindingList<ProcessingResult> _results = new();
     private ProcessingSession _session = new();
+    private readonly LatestValueDispatcher<string> _statusUpdates;
+    private readonly LatestValueDispatcher<ProgressEventArgs> _progressUpdates;
     
     // Data Source Properties
     private DataSourceType _selectedDataSourceType = DataSourceType.Local;
@@ -46,6 +48,18 @@ public class MainFormViewModel : INotifyPropertyChanged
         _serviceProvider = serviceProvider;
         _logger = logger;
         _owner = owner;
+
+        // Bursts of log and progress events from concurrently processed items collapse into one UI update each
+        _statusUpdates = new LatestValueDispatcher<string>(
+            update => _owner.BeginInvoke(update),
+            message => StatusMessage = message);
+        _progressUpdates = new LatestValueDispatcher<ProgressEventArgs>(
+            update => _owner.BeginInvoke(update),
+            progress =>
+            {
+                CurrentProgress = (int)progress.Percentage;
+                StatusMessage = $"Processing {progress.Current} of {progress.Total} items";
+            });
     }
 
     // Properties
@@ -277,18 +291,15 @@ public class MainFormViewModel : INotifyPropertyChanged
         StatusMessage = "Results cleared";
     }
 
+    // Posted to the UI thread's message queue so the processing worker never waits on a repaint
     private void OnLogMessage(object? sender, string message)
     {
-        _owner.Invoke(() => StatusMessage = message);
+        _statusUpdates.Post(message);
     }
     
     private void OnProgressChanged(object? sender, ProgressEventArgs e)
     {
-        _owner.Invoke(() =>
-        {
-            CurrentProgress = (int)e.Percentage;
-            StatusMessage = $"Processing {e.Current} of {e.Total} items";
-        });
+        _progressUpdates.Post(e);
     }
     
     private void CleanupProcessing()
@@ -298,11 +309,20 @@ public class MainFormViewModel : INotifyPropertyChanged
             _processingManager.LogMessage -= OnLogMessage;
             _processingManager.ProgressChanged -= OnProgressChanged;
             
-            // Add results to the collection
+            // Add results to the collection, refreshing the bound grid once rather than per row
             _owner.Invoke(() => {
-                foreach (var result in _session.Results)
+                Results.RaiseListChangedEvents = false;
+                try
+                {
+                    foreach (var result in _session.Results)
+                    {
+                        Results.Add(result);
+                    }
+                }
+                finally
                 {
-                    Results.Add(result);
+                    Results.RaiseListChangedEvents = true;
+                    Results.ResetBindings();
                 }
             });
         }